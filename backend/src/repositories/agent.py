@@ -310,7 +310,9 @@ class AgentRepository(CRUDBase[Agent, AgentCreate, AgentUpdate]):
         q = await db.execute(
             select(self.model).where(
                 and_(
-                    self.model.description.ilike(f"%{description_query}%"),
+                    self.model.description.icontains(
+                        description_query, autoescape=True
+                    ),
                     self.model.creator_id == str(user_model.id),
                 )
             )
@@ -329,7 +331,9 @@ class AgentRepository(CRUDBase[Agent, AgentCreate, AgentUpdate]):
             select(self.model)
             .where(
                 and_(
-                    self.model.description.ilike(f"%{description_query}%"),
+                    self.model.description.icontains(
+                        description_query, autoescape=True
+                    ),
                     self.model.creator_id == str(user_model.id),
                 )
             )
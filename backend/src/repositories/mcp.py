@@ -54,12 +54,12 @@ async def lookup_mcp_server(
             async with ClientSession(
                 write_stream=write_stream, read_stream=read_stream
             ) as session:
-                logger.debug(f"Initializing conn with MCP server: {url}")
+                logger.debug("Initializing conn with MCP server: %s", url)
                 await session.initialize()
 
                 tools = await session.list_tools()
 
-                logger.debug(f"Successfully got the mcp server data of: {url}")
+                logger.debug("Successfully got the mcp server data of: %s", url)
 
                 return MCPServerData(
                     mcp_tools=tools.tools,
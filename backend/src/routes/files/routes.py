@@ -14,6 +14,7 @@ from fastapi import (
     UploadFile,
     status,
 )
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import FileResponse
 from pydantic import ValidationError
 from src.auth.dependencies import CurrentUserByAgentOrUserTokenDependency
@@ -33,6 +34,11 @@ settings = get_settings()
 files_router = APIRouter(tags=["Files"])
 
 
+def save_upload_file(file: UploadFile, file_path: Path) -> None:
+    with file_path.open("wb") as buffer:
+        shutil.copyfileobj(file.file, buffer)
+
+
 @files_router.get("/files/{file_id}", response_class=FileResponse)
 async def get_file(
     file_id: str,
@@ -80,8 +86,8 @@ async def upload_file(
     file_path = Path(FILES_DIR) / internal_file_name
     # TODO: if request_id and session_id: from_agent=True
     try:
-        with file_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Disk I/O is blocking, keep it off the event loop
+        await run_in_threadpool(save_upload_file, file, file_path)
 
         session_id = str(session_id) if session_id else None
         request_id = str(request_id) if request_id else None
@@ -2,7 +2,7 @@ import asyncio
 import random
 import re
 import string
-from typing import Any, Optional
+from typing import Any, Awaitable, Iterable, Optional
 from urllib.parse import urlparse, urlunparse
 from uuid import UUID
 
@@ -23,6 +23,12 @@ from src.schemas.mcp.dto import MCPToolDTO
 from src.utils.enums import AgentType
 from src.utils.exceptions import InvalidToolNameException
 
+TOOL_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9_\\.-]+$")
+# Matches '(column)=(value)' pairs in IntegrityError messages
+INTEGRITY_ERROR_DETAILS_PATTERN = re.compile(r"\(([^)]+)\)=\(([^)]+)\)")
+# Upper bound on lookups of remote MCP servers / A2A agents running at once
+LOOKUP_CONCURRENCY_LIMIT = 10
+
 
 def generate_alias(agent_name: str):
     rand_alnum_str = "".join(random.choice(string.ascii_lowercase) for _ in range(6))
@@ -68,11 +74,10 @@ def mcp_tool_to_json_schema(
 
 def validate_tool_name(tool_name: str) -> Optional[str]:
     # TODO: enforce validation or rm this func
-    pattern = r"^[a-zA-Z0-9_\\.-]+$"
-    match = re.search(pattern=pattern, string=tool_name)
+    match = TOOL_NAME_PATTERN.search(tool_name)
     if not match:
         raise InvalidToolNameException(
-            f"Tool name: '{tool_name}' is invalid and must match the following regex pattern: {pattern}."
+            f"Tool name: '{tool_name}' is invalid and must match the following regex pattern: {TOOL_NAME_PATTERN.pattern}."
         )
 
     return tool_name
@@ -86,6 +91,26 @@ def get_agent_description_from_skills(
     return full_agent_description
 
 
+async def gather_with_concurrency(
+    coros: Iterable[Awaitable[Any]], limit: int = LOOKUP_CONCURRENCY_LIMIT
+) -> list[Any]:
+    """
+    Helper function to await coroutines concurrently, running at most `limit` of them at once
+    Params:
+        coros: coroutines to await
+        limit: max number of coroutines awaited at the same time
+    Returns:
+        Results in the order of `coros`, same as `asyncio.gather`
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coro: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros))
+
+
 def map_agent_model_to_dto(agent: Agent):
     """
     Helper function to map agent model to universal output structure
@@ -130,9 +155,7 @@ def prettify_integrity_error_details(msg: str) -> Optional[IntegrityErrorDetails
     where IntegrityError returns 'email' or 'username'
     as column name and value after the equal sign in the message
     """
-    pattern = r"\(([^)]+)\)=\(([^)]+)\)"
-
-    matches: list[Optional[tuple[str]]] = re.findall(pattern=pattern, string=msg)
+    matches: list[Optional[tuple[str]]] = INTEGRITY_ERROR_DETAILS_PATTERN.findall(msg)
     if matches:
         column = matches[0][0]
         value = matches[0][1]
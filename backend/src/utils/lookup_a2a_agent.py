@@ -1,10 +1,9 @@
-import asyncio
 import logging
 
 from src.db.session import async_session
 from src.repositories.a2a import a2a_repo, lookup_agent_well_known
 from src.utils.enums import AgentType
-from src.utils.helpers import FlowValidator
+from src.utils.helpers import FlowValidator, gather_with_concurrency
 
 logger = logging.getLogger(__name__)
 
@@ -31,15 +30,9 @@ async def lookup_a2a_agents(headers: dict = {}):
     async with async_session() as db:
         urls = await a2a_repo.get_all_card_server_urls(db)
 
-    tasks = []
-    for url in urls:
-        tasks.append(
-            asyncio.create_task(
-                lookup_and_update_agent_card(server_url=url, headers=headers)
-            )
-        )
-
-    cards = await asyncio.gather(*tasks)
+    cards = await gather_with_concurrency(
+        lookup_and_update_agent_card(server_url=url, headers=headers) for url in urls
+    )
     logger.info(f"Updated info about {len(cards)} A2A agents")
 
     return
@@ -1,10 +1,9 @@
-import asyncio
 import logging
 
 from src.db.session import async_session
 from src.repositories.mcp import lookup_mcp_server, mcp_repo
 from src.utils.enums import AgentType
-from src.utils.helpers import FlowValidator
+from src.utils.helpers import FlowValidator, gather_with_concurrency
 
 logger = logging.getLogger(__name__)
 
@@ -32,12 +31,9 @@ async def lookup_and_update_mcp_server(url: str, headers={}, cursor=None):
 async def lookup_mcp_servers():
     async with async_session() as db:
         urls: list[str] = await mcp_repo.list_remote_urls_of_all_servers(db=db)
-        tasks = []
 
-        for url in urls:
-            task = asyncio.create_task(lookup_and_update_mcp_server(url=url))
-            tasks.append(task)
-
-        results = await asyncio.gather(*tasks)
+        results = await gather_with_concurrency(
+            lookup_and_update_mcp_server(url=url) for url in urls
+        )
         logger.info(f"Updated info about {len(results)} MCP servers")
     return
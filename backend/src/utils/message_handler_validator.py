@@ -23,6 +23,151 @@ from starlette.datastructures import State
 logger = getLogger(__name__)
 
 
+async def _handle_agent_register(
+    session: GenAISession,
+    agent_uuid: str,
+    agent_description: Optional[str],
+    agent_input_schema: Optional[dict],
+    agent_name: Optional[str],
+    jwt_token: Optional[str],
+    **_,
+):
+    try:
+        async with async_session() as db:
+            valid_agent = await agent_repo.validate_agent_by_jwt(
+                db=db, agent_jwt=jwt_token
+            )
+            if not valid_agent:
+                logger.debug(
+                    "Agent with '%s' was attempted to register but either JWT is invalid or user does not exist.",  # noqa: E501
+                    agent_uuid,
+                )
+                await session.send(
+                    message={
+                        "error_message": "Agent ID was not registered before",
+                        "error_type": ErrorType.AGENT_GENERAL_ERROR.value,
+                    },
+                    client_id=agent_uuid,
+                    close_timeout=1,
+                )
+                return  # TODO: raise invalid agent jwt
+
+            old_name = "".join(valid_agent.alias.rsplit("_", 1)[:-1])
+            if agent_name == old_name:
+                alias = valid_agent.alias
+            else:
+                alias = generate_alias(agent_name)
+
+            agent_in = AgentUpdate(
+                id=valid_agent.id,
+                name=agent_name,
+                description=agent_description,
+                input_parameters=agent_input_schema or {},
+                is_active=True,
+                alias=alias,
+            )
+
+            updated_agent = await agent_repo.update(
+                db=db,
+                db_obj=valid_agent,
+                obj_in=agent_in,
+            )
+            flow_validator = FlowValidator()
+            await flow_validator.trigger_flow_validation_on_agent_state_change(
+                db=db, agent_type=AgentType.genai
+            )
+            await db.refresh(updated_agent)
+            logger.debug("Agent updated: %s", updated_agent.id)
+
+    except ValidationError as e:
+        logger.error(
+            f"Invalid agent_register event request schema. Details: {validation_exception_handler(e)}"
+        )
+        return
+    except Exception:
+        logger.error(f"Error while registering agent. Details: {format_exc(limit=600)}")
+        return
+
+
+async def _handle_agent_unregister(session: GenAISession, agent_uuid: str, **_):
+    try:
+        agent = await validate_agent_or_send_err(agent_uuid, session=session)
+        if not agent:
+            return
+
+        async with async_session() as db:
+            user = await user_repo.get(db=db, id_=agent.creator_id)
+            if not user:
+                logger.debug("No agent of user with id: '%s' found", agent.creator_id)
+                return
+            set_inactive_flows = await agentflow_repo.set_inactive_for_all_flows_where_deleted_agent_exists(
+                db=db, agent_id=str(agent.id), user_model=user
+            )
+            if set_inactive_flows:
+                logger.debug("Flows set as inactive: %s", "".join(set_inactive_flows))
+
+            inactive_agent = await agent_repo.set_agent_as_inactive(
+                db=db, id_=agent_uuid, user_id=agent.creator_id
+            )
+            if inactive_agent:
+                logger.debug("Set agent as inactive: %s", agent_uuid)
+
+    except ValidationError:
+        logger.error(
+            f"Invalid ML request schema. Details: {validation_exception_handler()}"
+        )
+        return
+
+    except Exception:
+        logger.error(
+            f"Error while unregistering agent. Details: {format_exc(limit=600)}"
+        )
+        return
+
+
+async def _handle_agent_log(
+    websocket: WebSocket,
+    message_type: str,
+    log_message: Optional[str],
+    log_level: Optional[str],
+    agent_uuid: str,
+    session_id: str,
+    request_id: str,
+    **_,
+):
+    if session_id and request_id and log_level:
+        try:
+            log_in = LogCreate(
+                session_id=session_id,
+                request_id=request_id,
+                message=log_message,
+                log_level=log_level,
+                agent_id=agent_uuid,
+            )
+            async with async_session() as db:
+                log_entry = await log_repo.create(db, obj_in=log_in)
+                logger.debug(
+                    "Inserted log for session_id=%r, request_id=%r",
+                    session_id,
+                    request_id,
+                )
+                log_out = LogEntry(**log_entry.__dict__)
+
+                if websocket:
+                    response = FrontendLogEntryDTO(type=message_type, log=log_out)
+                    await websocket.send_text(response.model_dump_json())
+
+        except Exception:
+            logger.error(f"Unexpected error occured: {traceback.format_exc()}")
+
+
+MESSAGE_HANDLERS = {
+    WSMessageType.AGENT_REGISTER.value: _handle_agent_register,
+    WSMessageType.AGENT_UNREGISTER.value: _handle_agent_unregister,
+    WSMessageType.AGENT_LOG.value: _handle_agent_log,
+}
+
+
 async def message_handler_validator(
     state: State,
     session: GenAISession,
@@ -41,129 +186,25 @@ async def message_handler_validator(
     # if websocket is not initialized it won't dump logs to the frontend
     websocket: WebSocket = state.frontend_ws
 
-    try:
-        if message_type == WSMessageType.AGENT_REGISTER.value:
-            try:
-                async with async_session() as db:
-                    valid_agent = await agent_repo.validate_agent_by_jwt(
-                        db=db, agent_jwt=jwt_token
-                    )
-                    if not valid_agent:
-                        logger.debug(
-                            f"Agent with '{agent_uuid}' was attempted to register but either JWT is invalid or user does not exist."  # noqa: E501
-                        )
-                        await session.send(
-                            message={
-                                "error_message": "Agent ID was not registered before",
-                                "error_type": ErrorType.AGENT_GENERAL_ERROR.value,
-                            },
-                            client_id=agent_uuid,
-                            close_timeout=1,
-                        )
-                        return  # TODO: raise invalid agent jwt
-
-                    old_name = "".join(valid_agent.alias.rsplit("_", 1)[:-1])
-                    if agent_name == old_name:
-                        alias = valid_agent.alias
-                    else:
-                        alias = generate_alias(agent_name)
-
-                    agent_in = AgentUpdate(
-                        id=valid_agent.id,
-                        name=agent_name,
-                        description=agent_description,
-                        input_parameters=agent_input_schema or {},
-                        is_active=True,
-                        alias=alias,
-                    )
-
-                    updated_agent = await agent_repo.update(
-                        db=db,
-                        db_obj=valid_agent,
-                        obj_in=agent_in,
-                    )
-                    flow_validator = FlowValidator()
-                    await flow_validator.trigger_flow_validation_on_agent_state_change(
-                        db=db, agent_type=AgentType.genai
-                    )
-                    await db.refresh(updated_agent)
-                    logger.debug(f"Agent updated: {str(updated_agent.id)}")
-
-            except ValidationError as e:
-                logger.error(
-                    f"Invalid agent_register event request schema. Details: {validation_exception_handler(e)}"
-                )
-                return
-            except Exception:
-                logger.error(
-                    f"Error while registering agent. Details: {format_exc(limit=600)}"
-                )
-                return
-
-        if message_type == WSMessageType.AGENT_UNREGISTER.value:
-            try:
-                agent = await validate_agent_or_send_err(agent_uuid, session=session)
-                if not agent:
-                    return
-
-                async with async_session() as db:
-                    user = await user_repo.get(db=db, id_=agent.creator_id)
-                    if not user:
-                        logger.debug(
-                            f"No agent of user with id: '{agent.creator_id}' found"
-                        )
-                        return
-                    set_inactive_flows = await agentflow_repo.set_inactive_for_all_flows_where_deleted_agent_exists(
-                        db=db, agent_id=str(agent.id), user_model=user
-                    )
-                    if set_inactive_flows:
-                        logger.debug(
-                            f"Flows set as inactive: {''.join(set_inactive_flows)}"
-                        )
-
-                    inactive_agent = await agent_repo.set_agent_as_inactive(
-                        db=db, id_=agent_uuid, user_id=agent.creator_id
-                    )
-                    if inactive_agent:
-                        logger.debug(f"Set agent as inactive: {agent_uuid}")
-
-            except ValidationError:
-                logger.error(
-                    f"Invalid ML request schema. Details: {validation_exception_handler()}"
-                )
-                return
-
-            except Exception:
-                logger.error(
-                    f"Error while unregistering agent. Details: {format_exc(limit=600)}"
-                )
-                return
-
-        if message_type == WSMessageType.AGENT_LOG.value:
-            if session_id and request_id and log_level:
-                try:
-                    log_in = LogCreate(
-                        session_id=session_id,
-                        request_id=request_id,
-                        message=log_message,
-                        log_level=log_level,
-                        agent_id=agent_uuid,
-                    )
-                    async with async_session() as db:
-                        log_entry = await log_repo.create(db, obj_in=log_in)
-                        logger.debug(f"Inserted log for {session_id=}, {request_id=}")
-                        log_out = LogEntry(**log_entry.__dict__)
-
-                        if websocket:
-                            response = FrontendLogEntryDTO(
-                                type=message_type, log=log_out
-                            )
-                            await websocket.send_text(response.model_dump_json())
-
-                except Exception:
-                    logger.error(f"Unexpected error occured: {traceback.format_exc()}")
+    handler = MESSAGE_HANDLERS.get(message_type)
+    if not handler:
+        return
 
-                return
+    try:
+        await handler(
+            websocket=websocket,
+            session=session,
+            message_type=message_type,
+            log_message=log_message,
+            log_level=log_level,
+            agent_uuid=agent_uuid,
+            agent_description=agent_description,
+            agent_input_schema=agent_input_schema,
+            agent_name=agent_name,
+            session_id=session_id,
+            request_id=request_id,
+            jwt_token=jwt_token,
+        )
 
     except KeyError:
         msg = "KeyError: Invalid payload structure - missing 'message_type' field"  # TODO: session_id?
@@ -23,7 +23,7 @@ async def validate_agent_or_send_err(
             # Check if the agent already exists
             existing_agent = await agent_repo.get(db=db, id_=agent_uuid)
             if existing_agent:
-                logger.debug(f"Agent exists: {str(existing_agent.id)}")
+                logger.debug("Agent exists: %s", existing_agent.id)
                 return existing_agent
 
             await session.send(
@@ -2,6 +2,7 @@ import json
 import pathlib
 import platform
 import os
+import stat
 from typing import Optional
 
 import typer
@@ -58,14 +59,35 @@ class CredentialsManager:
                 "Credentials file is invalid or malformed. Please log in again."
             )
 
+    def _write_creds_file(self, content: str) -> None:
+        """
+        Writes the credentials file atomically: content goes to a temporary file
+        in the same folder which then replaces the credentials file, so concurrent
+        CLI runs never see a truncated or half-written file. The replaced file keeps
+        the mode of the existing one, a new file is readable by the owner only
+        """
+        creds_path = self.get_creds_fp()
+        tmp_path = creds_path.with_name(f"{creds_path.name}.{os.getpid()}.tmp")
+        try:
+            mode = stat.S_IMODE(creds_path.stat().st_mode)
+        except FileNotFoundError:
+            mode = 0o600
+
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, "w") as f:
+                f.write(content)
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, creds_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
     def dump_credentials(self, access_token: str) -> None:
         config_dir = self.get_config_dir()
-        creds_path = self.get_creds_fp()
 
         try:
             config_dir.mkdir(parents=True, exist_ok=True)
-            with open(creds_path, "w+") as f:
-                json.dump({"token": access_token}, f)
+            self._write_creds_file(json.dumps({"token": access_token}))
 
         except OSError as e:
             render_error(
@@ -74,7 +96,14 @@ class CredentialsManager:
             raise typer.Exit(code=1)
 
     def logout(self):
-        with open(self.get_creds_fp(), "w+") as creds_file:
-            creds_file.write("{}")
-            render_success("Logged out successfully!")
+        try:
+            self._write_creds_file("{}")
+
+        except OSError as e:
+            render_error(
+                f"Error: Could not write credentials file at {self.get_creds_fp()}: {e}"
+            )
+            raise typer.Exit(code=1)
+
+        render_success("Logged out successfully!")
         return
@@ -12,6 +12,8 @@ else:
 
 parent_exec_folder = pathlib.Path.cwd()
 
+AGENT_NAME_INVALID_CHARS_PATTERN = re.compile(r"[^a-zA-Z0-9_]")
+
 
 def generate_uv_pyproject_toml(env: Environment, folder: pathlib.Path):
     template = "pyproject_toml.j2"
@@ -30,8 +32,8 @@ def generate_uv_pyproject_toml(env: Environment, folder: pathlib.Path):
 def generate_agent_file(agent_body: AgentSchema) -> None:
     env = Environment(loader=FileSystemLoader(f"{jinja_folder_path}"))
     template = env.get_template("agent_template.j2")
-    agent_name = re.sub(
-        r"[^a-zA-Z0-9_]", "", agent_body.agent_name.replace(" ", "_").lower()
+    agent_name = AGENT_NAME_INVALID_CHARS_PATTERN.sub(
+        "", agent_body.agent_name.replace(" ", "_").lower()
     )
     rendered = template.render(
         agent_token=agent_body.agent_jwt,
@@ -11,6 +11,10 @@ from pydantic import BaseModel
 from src.log import render_error
 from src.exceptions import DependencyError
 
+GENAI_SESSION_PATTERN = re.compile(
+    r"(from genai_session\.session import GenAISession)|(GenAISession)|(@session\.bind)"
+)
+
 
 class AgentFolderContent(BaseModel):
     agent_name: str
@@ -112,10 +116,9 @@ class AgentDependencyManager:
         Helper function that applies a regex pattern versus the text content of the python file
         If 3 matches are found -> python file is considered a valid genai agent, everything else is invalid
         """
-        re_pattern = r"(from genai_session\.session import GenAISession)|(GenAISession)|(@session\.bind)"
         with open(py_file_fp, "r+") as f:
             content = f.read()
-            matches = re.findall(pattern=re_pattern, string=content)
+            matches = GENAI_SESSION_PATTERN.findall(content)
             if len(matches) == 3:
                 return True
             else:
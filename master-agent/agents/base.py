@@ -9,6 +9,7 @@ from langgraph.constants import END, START
 from langgraph.graph.state import CompiledStateGraph, StateGraph
 from loguru import logger
 
+from connectors.entities import A2AConfig, AgentTypeEnum, GenAIConfig, GenAIFlowConfig, MCPConfig
 from models.enums import Nodes
 from models.exceptions import UnknownAgentTypeException
 from models.states import MasterAgentState
@@ -20,6 +21,7 @@ class BaseMasterAgent(ABC):
         self.model = model
         self.agents = agents
         self._agents_to_bind_to_llm = [item["agent_schema"] for item in agents]
+        self._agents_by_name = {item["name"]: item for item in agents}
 
     @abstractmethod
     def select_agent(self, state: MasterAgentState):
@@ -34,58 +36,101 @@ class BaseMasterAgent(ABC):
             return Nodes.execute_agent.value
         return END
 
+    def _build_genai_config(
+            self,
+            agent: dict[str, Any],
+            agent_call: dict[str, Any],
+            config: RunnableConfig,
+            **_
+    ):
+        return GenAIConfig(
+            id=agent.get("id"),
+            name=remove_last_underscore_segment(agent_call["name"]),
+            arguments=agent_call["args"],
+            session=config.get("configurable", {}).get("session")
+        )
+
+    def _build_flow_config(
+            self,
+            agent: dict[str, Any],
+            agent_call: dict[str, Any],
+            state: MasterAgentState,
+            config: RunnableConfig,
+            **_
+    ):
+        return GenAIFlowConfig(
+            id=agent.get("id"),
+            name=remove_last_underscore_segment(agent_call["name"]),
+            agents=filter_and_order_by_ids(
+                ids=agent.get("flow", []),
+                items=self.agents
+            ),
+            model=self.model,
+            messages=state.messages[:-1],  # exclude last AI message
+            session=config.get("configurable", {}).get("session")
+        )
+
+    def _build_mcp_config(
+            self,
+            agent: dict[str, Any],
+            agent_call: dict[str, Any],
+            **_
+    ):
+        return MCPConfig(
+            id=agent.get("id"),
+            name=remove_last_underscore_segment(agent_call["name"]),
+            endpoint=agent.get("url", ""),
+            arguments=agent_call["args"]
+        )
+
+    def _build_a2a_config(
+            self,
+            agent: dict[str, Any],
+            agent_call: dict[str, Any],
+            **_
+    ):
+        return A2AConfig(
+            id=agent.get("id"),
+            name=remove_last_underscore_segment(agent_call["name"]),
+            endpoint=agent.get("url"),
+            task=agent_call["args"]["task"],
+            text=agent_call["args"]["text"]
+        )
+
+    # Agent type -> builder of its connector config
+    AGENT_CONFIG_BUILDERS = {
+        AgentTypeEnum.gen_ai.value: _build_genai_config,
+        AgentTypeEnum.flow.value: _build_flow_config,
+        AgentTypeEnum.mcp.value: _build_mcp_config,
+        AgentTypeEnum.a2a.value: _build_a2a_config,
+    }
+
     async def execute_agent(self, state: MasterAgentState, config: RunnableConfig):
         """
         Calls remote agent selected by Supervisor using AIConnector library.
         """
-        from connectors.entities import AgentTypeEnum, GenAIConfig, GenAIFlowConfig, MCPConfig, A2AConfig
         from connectors.factory import ConnectorFactory
 
         messages = state.messages
         agent_call = messages[-1].tool_calls[0]
         agent_name = agent_call["name"]
 
-        agent_to_execute = [agent for agent in self.agents if agent["name"] == agent_name][0]
+        agent_to_execute = self._agents_by_name[agent_name]
         agent_type = agent_to_execute["type"]
 
         try:
-            if agent_type == AgentTypeEnum.gen_ai.value:
-                agent_config = GenAIConfig(
-                    id=agent_to_execute.get("id"),
-                    name=remove_last_underscore_segment(agent_name),
-                    arguments=agent_call["args"],
-                    session=config.get("configurable", {}).get("session")
-                )
-            elif agent_type == AgentTypeEnum.flow.value:
-                agent_config = GenAIFlowConfig(
-                    id=agent_to_execute.get("id"),
-                    name=remove_last_underscore_segment(agent_name),
-                    agents=filter_and_order_by_ids(
-                        ids=agent_to_execute.get("flow", []),
-                        items=self.agents
-                    ),
-                    model=self.model,
-                    messages=messages[:-1].copy(),  # exclude last AI message
-                    session=config.get("configurable", {}).get("session")
-                )
-            elif agent_type == AgentTypeEnum.mcp.value:
-                agent_config = MCPConfig(
-                    id=agent_to_execute.get("id"),
-                    name=remove_last_underscore_segment(agent_name),
-                    endpoint=agent_to_execute.get("url", ""),
-                    arguments=agent_call["args"]
-                )
-            elif agent_type == AgentTypeEnum.a2a.value:
-                agent_config = A2AConfig(
-                    id=agent_to_execute.get("id"),
-                    name=remove_last_underscore_segment(agent_name),
-                    endpoint=agent_to_execute.get("url"),
-                    task=agent_call["args"]["task"],
-                    text=agent_call["args"]["text"]
-                )
-            else:
+            build_agent_config = self.AGENT_CONFIG_BUILDERS.get(agent_type)
+            if build_agent_config is None:
                 raise UnknownAgentTypeException(f"Unknown agent type: {agent_type}")
 
+            agent_config = build_agent_config(
+                self,
+                agent=agent_to_execute,
+                agent_call=agent_call,
+                state=state,
+                config=config
+            )
+
             connector = ConnectorFactory.get_connector(agent_config)
 
             logger.info(f"Invoking {agent_name} ({agent_type}) with parameters: {agent_call["args"]}")
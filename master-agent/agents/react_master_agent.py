@@ -25,7 +25,6 @@ class ReActMasterAgent(BaseMasterAgent):
             agents (list[dict[str, Any]]): List of available agents
         """
         super().__init__(model, agents)
-        self._agents_to_bind_to_llm = [item["agent_schema"] for item in agents]
 
     async def select_agent(self, state: MasterAgentState):
         """
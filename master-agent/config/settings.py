@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from dotenv import load_dotenv
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -24,4 +26,15 @@ class Settings(BaseSettings):
     SECRET_KEY: str = Field(
         default="GenAI-ddc5e9f5-c340-4dcc-9872-d7f098b6b172",
         alias="SECRET_KEY"
-    )
\ No newline at end of file
+    )
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Get the settings object, parsing the environment only once.
+
+    Returns:
+        Settings: The settings object.
+    """
+    return Settings()
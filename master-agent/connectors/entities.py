@@ -2,13 +2,14 @@ import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from genai_session.session import GenAISession
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage
 
-from agents.flow_master_agent import FlowMasterAgent
+if TYPE_CHECKING:
+    from agents.flow_master_agent import FlowMasterAgent
 
 
 class AgentTypeEnum(Enum):
@@ -18,14 +19,14 @@ class AgentTypeEnum(Enum):
     flow = "flow"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig(ABC):
     id: str
     name: str
     agent_type: str = field(init=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class A2AConfig(AgentConfig):
     endpoint: str
     task: str
@@ -39,7 +40,7 @@ class A2AConfig(AgentConfig):
         self.action = f"{self.task}\n{self.text}"
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPConfig(AgentConfig):
     endpoint: str
     arguments: dict
@@ -48,7 +49,7 @@ class MCPConfig(AgentConfig):
         self.agent_type = AgentTypeEnum.mcp.value
 
 
-@dataclass
+@dataclass(slots=True)
 class GenAIConfig(AgentConfig):
     arguments: dict
     session: GenAISession
@@ -57,15 +58,18 @@ class GenAIConfig(AgentConfig):
         self.agent_type = AgentTypeEnum.gen_ai.value
 
 
-@dataclass
+@dataclass(slots=True)
 class GenAIFlowConfig(AgentConfig):
     agents: list[dict[str, Any]]
     model: BaseChatModel
     messages: list[BaseMessage]
     session: GenAISession
-    flow_master_agent: FlowMasterAgent = field(init=False)
+    flow_master_agent: "FlowMasterAgent" = field(init=False)
 
     def __post_init__(self):
+        # Imported here, the agents package imports this module
+        from agents.flow_master_agent import FlowMasterAgent
+
         self.agent_type = AgentTypeEnum.flow.value
         self.flow_master_agent = FlowMasterAgent(
             model=self.model,
@@ -3,12 +3,12 @@ from typing import Any, cast
 from a2a.client import A2AClient
 from a2a.types import MessageSendParams, SendMessageRequest, SendMessageSuccessResponse
 from genai_session.session import GenAISession
-from httpx import AsyncClient
 from loguru import logger
 from mcp.client.session import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
 
 from connectors.entities import ConnectorStrategy, A2AConfig, GenAIConfig, MCPConfig, GenAIFlowConfig
+from utils.http_client import get_a2a_http_client
 from utils.tracing import trace_execution_time
 
 
@@ -66,44 +66,42 @@ class A2AConnector(ConnectorStrategy):
             "input": config.action,
         }
         try:
-            async with AsyncClient() as httpx_client:
-                client = await A2AClient.get_client_from_agent_card_url(
-                    httpx_client, config.endpoint
-                )
-                client.url = config.endpoint
-
-                send_message_payload: dict[str, Any] = {
-                    "message": {
-                        "role": config.role,
-                        "messageId": config.message_id,
-                        "parts": [
-                            {
-                                "type": "text",
-                                "text": config.action
-                            }
-                        ],
-                    },
+            # Share the pooled A2A client, the RPC endpoint is already known so skip the
+            # agent card discovery round-trip
+            client = A2AClient(get_a2a_http_client(), url=config.endpoint)
+
+            send_message_payload: dict[str, Any] = {
+                "message": {
+                    "role": config.role,
+                    "messageId": config.message_id,
+                    "parts": [
+                        {
+                            "type": "text",
+                            "text": config.action
+                        }
+                    ],
+                },
+            }
+            request = SendMessageRequest(
+                params=MessageSendParams(**send_message_payload)
+            )
+
+            async with trace_execution_time(trace=trace):
+                response = await client.send_message(request, http_kwargs={"timeout": None})
+
+            if isinstance(response.root, SendMessageSuccessResponse):
+                response_text = response.root.result.artifacts[0].parts[0].root.text
+            else:
+                response_text = response.root.error.message
+
+            trace.update(
+                {
+                    "output": response.model_dump(mode="json"),
+                    "is_success": isinstance(response.root, SendMessageSuccessResponse)
                 }
-                request = SendMessageRequest(
-                    params=MessageSendParams(**send_message_payload)
-                )
-
-                async with trace_execution_time(trace=trace):
-                    response = await client.send_message(request, http_kwargs={"timeout": None})
-
-                if isinstance(response.root, SendMessageSuccessResponse):
-                    response_text = response.root.result.artifacts[0].parts[0].root.text
-                else:
-                    response_text = response.root.error.message
-
-                trace.update(
-                    {
-                        "output": response.model_dump(mode="json"),
-                        "is_success": isinstance(response.root, SendMessageSuccessResponse)
-                    }
-                )
-
-                return response_text, trace
+            )
+
+            return response_text, trace
 
         except Exception as e:
             error_message = f"Unexpected error while invoking A2A agent: {e}"
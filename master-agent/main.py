@@ -7,14 +7,19 @@ from langchain_core.messages import SystemMessage
 from loguru import logger
 
 from agents.react_master_agent import ReActMasterAgent
-from config.settings import Settings
+from config.settings import get_settings
 from llms import LLMFactory
 from prompts import FILE_RELATED_SYSTEM_PROMPT
 from utils.agents import get_agents
 from utils.chat_history import get_chat_history
 from utils.common import attach_files_to_message
+from utils.http_client import close_http_client
 
-app_settings = Settings()
+app_settings = get_settings()
+
+# Backend endpoints are fixed for the process lifetime, build them once
+CHAT_HISTORY_URL = f"{app_settings.BACKEND_API_URL}/chat"
+ACTIVE_AGENTS_URL = f"{app_settings.BACKEND_API_URL}/agents/active"
 
 session = GenAISession(
     api_key=app_settings.MASTER_AGENT_API_KEY,
@@ -40,12 +45,21 @@ async def receive_message(
         system_prompt = user_system_prompt or base_system_prompt
         system_prompt = f"{system_prompt}\n\n{FILE_RELATED_SYSTEM_PROMPT}"
 
-        chat_history = await get_chat_history(
-            f"{app_settings.BACKEND_API_URL}/chat",
-            session_id=session_id,
-            user_id=user_id,
-            api_key=app_settings.MASTER_BE_API_KEY,
-            max_last_messages=configs.get("max_last_messages", 5)
+        # Chat history and active agents are independent backend calls, fetch them concurrently
+        chat_history, agents = await asyncio.gather(
+            get_chat_history(
+                CHAT_HISTORY_URL,
+                session_id=session_id,
+                user_id=user_id,
+                api_key=app_settings.MASTER_BE_API_KEY,
+                max_last_messages=configs.get("max_last_messages", 5)
+            ),
+            get_agents(
+                url=ACTIVE_AGENTS_URL,
+                agent_type="all",
+                api_key=app_settings.MASTER_BE_API_KEY,
+                user_id=user_id
+            )
         )
 
         chat_history[-1] = attach_files_to_message(message=chat_history[-1], files=files) if files else chat_history[-1]
@@ -54,13 +68,6 @@ async def receive_message(
             *chat_history
         ]
 
-        agents = await get_agents(
-            url=f"{app_settings.BACKEND_API_URL}/agents/active",
-            agent_type="all",
-            api_key=app_settings.MASTER_BE_API_KEY,
-            user_id=user_id
-        )
-
         llm = LLMFactory.create(configs=configs)
         master_agent = ReActMasterAgent(model=llm, agents=agents)
 
@@ -91,7 +98,10 @@ async def receive_message(
 
 async def main():
     logger.info("Master Agent started")
-    await session.process_events()
+    try:
+        await session.process_events()
+    finally:
+        await close_http_client()
 
 
 if __name__ == "__main__":
@@ -1,24 +1,23 @@
 from typing import Any
 
-import httpx
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import BaseMessage, AIMessage
 from langchain_openai import ChatOpenAI
 
 from llms.custom import ChatGenAI
 from utils.common import bind_tools_safely, generate_hmac, combine_messages
-from config.settings import Settings
+from config.settings import get_settings
+from utils.http_client import get_http_client
 
 async def get_agents(url: str, agent_type: str, api_key: str, user_id: str):
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            url,
-            headers={"X-API-KEY": api_key},
-            params={"agent_type": agent_type, "user_id": user_id},
-        )
+    response = await get_http_client().get(
+        url,
+        headers={"X-API-KEY": api_key},
+        params={"agent_type": agent_type, "user_id": user_id},
+    )
 
-        response.raise_for_status()
-        agents = response.json()
+    response.raise_for_status()
+    agents = response.json()
 
     return agents["active_connections"]
 
@@ -32,7 +31,7 @@ async def select_agent_and_resolve_parameters(
     if isinstance(model, ChatGenAI):
         model_json = model.model_dump()
         model_json["default_headers"] = {
-            "X-HMAC": generate_hmac(Settings().SECRET_KEY, combine_messages(messages))
+            "X-HMAC": generate_hmac(get_settings().SECRET_KEY, combine_messages(messages))
         }
         model = ChatOpenAI.model_validate(model_json)
 
@@ -0,0 +1,54 @@
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+
+# Connection attempts are retried with exponential backoff, so a backend restart does not fail
+# every in-flight request immediately. Requests that reached the backend are never retried
+CONNECT_RETRIES = 3
+
+# Keep as many idle connections as may be opened, so bursts of concurrent chats do not churn
+# connections. Idle ones expire just before uvicorn's default 5s keep-alive timeout closes them
+# on the backend side, so the pool never hands out a socket the server is about to drop
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=100, keepalive_expiry=4.0)
+
+# A2A agents are arbitrary third-party hosts whose calls are sent without a timeout, so they get
+# a pool of their own that can never starve the backend calls. The pool is not capped: with no
+# timeout, waiting for a free connection would block forever once every slot hangs
+A2A_HTTP_LIMITS = httpx.Limits(max_connections=None, max_keepalive_connections=20)
+
+_http_client: httpx.AsyncClient | None = None
+_a2a_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Returns process-wide HTTP client, so calls to the backend reuse pooled keep-alive connections
+    instead of opening a new connection on every request.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(retries=CONNECT_RETRIES, limits=HTTP_LIMITS)
+        )
+    return _http_client
+
+
+def get_a2a_http_client() -> httpx.AsyncClient:
+    """
+    Returns process-wide HTTP client for calls to A2A agents, kept apart from the backend one.
+    """
+    global _a2a_http_client
+    if _a2a_http_client is None or _a2a_http_client.is_closed:
+        # The client is shared by every user, so never store cookies that an agent sets in
+        # answer to one user and replay them on calls made for another
+        _a2a_http_client = httpx.AsyncClient(
+            limits=A2A_HTTP_LIMITS,
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+        )
+    return _a2a_http_client
+
+
+async def close_http_client() -> None:
+    for client in (_http_client, _a2a_http_client):
+        if client is not None and not client.is_closed:
+            await client.aclose()
@@ -1,8 +1,10 @@
+import asyncio
 import json
 import logging
 import jwt
+import orjson
 
-from typing import Dict
+from typing import Any, Dict
 
 from fastapi import WebSocket
 from settings import get_settings
@@ -10,6 +12,62 @@ from utils.enums import WSMessageType, MasterServerName, ErrorType
 
 app_settings = get_settings()
 
+logger = logging.getLogger(__name__)
+
+
+def dumps_message(message: Any) -> str:
+    """
+    Serializes an outgoing message with orjson, falling back to the stdlib encoder
+    (which is what decoded the message) wherever orjson would not reproduce the value.
+
+    orjson raises on integers beyond 64 bits and lone surrogates, and silently writes
+    NaN and infinities as null. Any output containing null is therefore re-encoded
+    with the stdlib encoder, which costs a second pass only for payloads with nulls.
+    """
+    try:
+        encoded = orjson.dumps(message)
+    except TypeError:
+        return json.dumps(message)
+    if b"null" in encoded:
+        return json.dumps(message)
+    return encoded.decode()
+
+
+# Static error replies, serialized once instead of on every failed message
+INVALID_JSON_ERROR = orjson.dumps(
+    {
+        "error": {
+            "error_message": "Invalid JSON format",
+            "error_type": ErrorType.INVALID_JSON_REQUEST_FORMAT.value,
+        }
+    }
+).decode()
+NO_REQUEST_PAYLOAD_ERROR = orjson.dumps(
+    {
+        "error": {
+            "error_message": "Missing request payload or agent UUID",
+            "error_type": ErrorType.NO_REQUEST_PAYLOAD.value,
+        }
+    }
+).decode()
+AGENT_NOT_ACTIVE_ERROR = orjson.dumps(
+    {
+        "error": {
+            "error_message": "Agent is NOT active",
+            "error_type": ErrorType.AGENT_NOT_ACTIVE.value,
+        }
+    }
+).decode()
+AGENT_NOT_ACTIVE_AGENT_ERROR = orjson.dumps(
+    {
+        "message_type": WSMessageType.AGENT_ERROR.value,
+        "error": {
+            "error_message": "Agent is NOT active",
+            "error_type": ErrorType.AGENT_NOT_ACTIVE.value,
+        },
+    }
+).decode()
+
 
 class WSConnectionManager:
     """
@@ -25,137 +83,182 @@ class WSConnectionManager:
 
     def __init__(self):
         """
-        Initializes the WebSocket connection manager with an empty active connections dictionary.
+        Initializes the WebSocket connection manager with an empty active connections dictionary
+        and the message type -> handler dispatch table.
         """
         self.active_connections: Dict[str, WebSocket] = {}
+        self._message_handlers = {
+            WSMessageType.AGENT_REGISTER.value: self._handle_agent_register,
+            WSMessageType.AGENT_RESPONSE.value: self._handle_agent_response,
+            WSMessageType.AGENT_ERROR.value: self._handle_agent_response,
+            WSMessageType.AGENT_INVOKE.value: self._handle_agent_invoke,
+            WSMessageType.AGENT_LOG.value: self._handle_agent_log,
+        }
 
     async def process_message(
-        self, client_id: str, message: str, agent_jwt: str
+        self, client_id: str, message: str | bytes, agent_jwt: str
     ) -> None:
         """
         Processes incoming messages from clients and routes them based on message type.
 
         Args:
             client_id (str): The ID of the client sending the message.
-            message (str): The message content as a JSON string.
+            message (str | bytes): The message content as a JSON text or binary frame,
+                either a single message object or an array of them.
         """
+        # Decoded with the stdlib parser on purpose: orjson turns integers beyond
+        # 64 bits into floats and rejects lone surrogates, which would alter relayed payloads
         try:
             data = json.loads(message)
-            logging.debug(f"Received message: {data}")
-        except json.JSONDecodeError:
+            logger.debug("Received message: %s", data)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            await self.send_message(
+                client_id=client_id,
+                message=INVALID_JSON_ERROR,
+            )
+        else:
+            if isinstance(data, list):
+                # A frame may carry a batch of messages; relay them in order
+                for item in data:
+                    await self._dispatch_message(client_id, item, None, agent_jwt)
+            else:
+                await self._dispatch_message(client_id, data, message, agent_jwt)
+
+    async def _dispatch_message(
+        self, client_id: str, data: Any, message: str | bytes | None, agent_jwt: str
+    ) -> None:
+        """
+        Routes a single decoded message to the handler for its message type.
+
+        Args:
+            client_id (str): The ID of the client sending the message.
+            data (Any): The decoded message.
+            message (str | bytes | None): The raw message, echoed back on unexpected input.
+                None for an item of a batch, which is only serialized if it has to be echoed.
+        """
+        handler = None
+        if isinstance(data, dict):
+            message_type = data.get("message_type")
+            if isinstance(message_type, str):
+                handler = self._message_handlers.get(message_type)
+
+        if handler is None:
+            if message is None:
+                message = dumps_message(data)
+            elif isinstance(message, bytes):
+                message = message.decode(errors="replace")
             await self.send_message(
                 client_id=client_id,
                 message={
                     "error": {
-                        "error_message": "Invalid JSON format",
-                        "error_type": ErrorType.INVALID_JSON_REQUEST_FORMAT.value,
+                        "error_message": f"Unexpected exception: {message}",
+                        "error_type": ErrorType.AGENT_GENERAL_ERROR.value,
                     }
                 },
             )
-        else:
-            message_type = data.pop("message_type", None)
-            agent_uuid = data.pop("agent_uuid", None)
-            payload = data.get("request_payload")
-
-            if message_type == WSMessageType.AGENT_REGISTER.value:
-                if client_id not in self.MASTER_SERVERS_API_KEY_MAPPING.values():
-                    request_payload = {
-                        "request_payload": {
-                            **payload,
-                            "agent_uuid": client_id,
-                            "agent_jwt": agent_jwt,
-                            "message_type": message_type,
-                        }
-                    }
+            return
 
-                    # Register the agent in SQL Database
-                    await self.send_message(
-                        client_id=MasterServerName.MASTER_SERVER_BE.value,
-                        message=request_payload,
-                    )
+        del data["message_type"]
+        agent_uuid = data.pop("agent_uuid", None)
+        payload = data.get("request_payload")
+        await handler(
+            client_id=client_id,
+            message_type=message_type,
+            agent_uuid=agent_uuid,
+            payload=payload,
+            data=data,
+            agent_jwt=agent_jwt,
+        )
 
-            elif message_type in (
-                WSMessageType.AGENT_RESPONSE.value,
-                WSMessageType.AGENT_ERROR.value,
-            ):
-                invoked_by = data.pop("invoked_by", None)
-                data["message_type"] = message_type
-                logging.info(
-                    f"Got response: {data}, from: {client_id}, invoked_by: {invoked_by}"
-                )
-                await self.send_message(invoked_by, data)
-
-            elif message_type == WSMessageType.AGENT_INVOKE.value:
-                if not payload and not agent_uuid:
-                    await self.send_message(
-                        client_id=client_id,
-                        message={
-                            "error": {
-                                "error_message": "Missing request payload or agent UUID",
-                                "error_type": ErrorType.NO_REQUEST_PAYLOAD.value,
-                            }
-                        },
-                    )
-
-                if agent_uuid not in self.active_connections:
-                    await self.send_message(
-                        client_id=client_id,
-                        message={
-                            "message_type": WSMessageType.AGENT_ERROR.value,
-                            "error": {
-                                "error_message": "Agent is NOT active",
-                                "error_type": ErrorType.AGENT_NOT_ACTIVE.value,
-                            },
-                        },
-                    )
-
-                if (
-                    agent_uuid == MasterServerName.MASTER_SERVER_ML.value
-                    and not client_id.startswith(app_settings.MASTER_BE_API_KEY)
-                ):
-                    await self.send_message(
-                        client_id=client_id,
-                        message={
-                            "error": {
-                                "error_message": "Agent is NOT active",
-                                "error_type": ErrorType.AGENT_NOT_ACTIVE.value,
-                            }
-                        },
-                    )
-                else:
-                    if (
-                        client_id.startswith(app_settings.MASTER_BE_API_KEY)
-                        and "error_message" in payload
-                    ):
-                        payload["message_type"] = WSMessageType.AGENT_ERROR.value
-                        payload = {"error": payload}
-                        await self.send_message(agent_uuid, payload)
-                    else:
-                        data["invoked_by"] = client_id
-                        await self.send_message(agent_uuid, data)
-
-            elif message_type == WSMessageType.AGENT_LOG.value:
-                await self.send_message(
-                    client_id=MasterServerName.MASTER_SERVER_BE.value,
-                    message={
-                        "request_payload": {
-                            "message_type": message_type,
-                            "agent_uuid": client_id,
-                            **data,
-                        },
-                    },
-                )
+    async def _handle_agent_register(
+        self, client_id: str, message_type: str, payload: dict, agent_jwt: str, **_
+    ) -> None:
+        """
+        Forwards an agent registration request to the Master BE.
+        """
+        if client_id not in self.MASTER_SERVERS_API_KEY_MAPPING.values():
+            request_payload = {
+                "request_payload": {
+                    **payload,
+                    "agent_uuid": client_id,
+                    "agent_jwt": agent_jwt,
+                    "message_type": message_type,
+                }
+            }
 
+            # Register the agent in SQL Database
+            await self.send_message(
+                client_id=MasterServerName.MASTER_SERVER_BE.value,
+                message=request_payload,
+            )
+
+    async def _handle_agent_response(
+        self, client_id: str, message_type: str, data: dict, **_
+    ) -> None:
+        """
+        Relays an agent response or error back to the client that invoked the agent.
+        """
+        invoked_by = data.pop("invoked_by", None)
+        data["message_type"] = message_type
+        logger.info(
+            "Got response: %s, from: %s, invoked_by: %s", data, client_id, invoked_by
+        )
+        await self.send_message(invoked_by, data)
+
+    async def _handle_agent_invoke(
+        self, client_id: str, agent_uuid: str, payload: dict, data: dict, **_
+    ) -> None:
+        """
+        Relays an invocation request to the target agent.
+        """
+        if not payload and not agent_uuid:
+            await self.send_message(
+                client_id=client_id,
+                message=NO_REQUEST_PAYLOAD_ERROR,
+            )
+
+        if agent_uuid not in self.active_connections:
+            await self.send_message(
+                client_id=client_id,
+                message=AGENT_NOT_ACTIVE_AGENT_ERROR,
+            )
+
+        if (
+            agent_uuid == MasterServerName.MASTER_SERVER_ML.value
+            and not client_id.startswith(app_settings.MASTER_BE_API_KEY)
+        ):
+            await self.send_message(
+                client_id=client_id,
+                message=AGENT_NOT_ACTIVE_ERROR,
+            )
+        else:
+            if (
+                client_id.startswith(app_settings.MASTER_BE_API_KEY)
+                and "error_message" in payload
+            ):
+                payload["message_type"] = WSMessageType.AGENT_ERROR.value
+                payload = {"error": payload}
+                await self.send_message(agent_uuid, payload)
             else:
-                await self.send_message(
-                    client_id=client_id,
-                    message={
-                        "error": {
-                            "error_message": f"Unexpected exception: {message}",
-                            "error_type": ErrorType.AGENT_GENERAL_ERROR.value,
-                        }
-                    },
-                )
+                data["invoked_by"] = client_id
+                await self.send_message(agent_uuid, data)
+
+    async def _handle_agent_log(
+        self, client_id: str, message_type: str, data: dict, **_
+    ) -> None:
+        """
+        Forwards an agent log entry to the Master BE.
+        """
+        await self.send_message(
+            client_id=MasterServerName.MASTER_SERVER_BE.value,
+            message={
+                "request_payload": {
+                    "message_type": message_type,
+                    "agent_uuid": client_id,
+                    **data,
+                },
+            },
+        )
 
     async def send_message(self, client_id: str, message: str | dict):
         """
@@ -165,8 +268,8 @@ class WSConnectionManager:
             client_id (str): The client ID to which the message should be sent.
             message (str | dict): The message content, can be a string or a dictionary.
         """
-        message = json.dumps(message) if isinstance(message, dict) else message
-        logging.info(f"Sending message: {message}, to: {client_id}")
+        message = dumps_message(message) if isinstance(message, dict) else message
+        logger.info("Sending message: %s, to: %s", message, client_id)
         if websocket := self.active_connections.get(client_id):
             await websocket.send_text(message)
 
@@ -208,11 +311,9 @@ class WSConnectionManager:
         Args:
             client_id (str): The ID of the client to disconnect.
         """
-        if client_id not in self.active_connections:
+        if self.active_connections.pop(client_id, None) is None:
             return
 
-        del self.active_connections[client_id]
-
         if not client_id.startswith(
             app_settings.MASTER_BE_API_KEY
         ):  # Ignore sockets from Master BE
@@ -226,17 +327,37 @@ class WSConnectionManager:
                 },
             )
 
-        for connection_id in (
-            self.active_connections
-        ):  # Clean up all connections created via session.send
-            if client_id in connection_id:
-                await self.send_message(
-                    client_id=connection_id,
-                    message={
-                        "message_type": WSMessageType.AGENT_ERROR.value,
-                        "error": {
-                            "error_message": "Agent has been unregistered",
-                            "agent_uuid": client_id,
-                        },
-                    },
+        # The notice is the same for every peer, so serialize it once
+        unregistered_message = orjson.dumps(
+            {
+                "message_type": WSMessageType.AGENT_ERROR.value,
+                "error": {
+                    "error_message": "Agent has been unregistered",
+                    "agent_uuid": client_id,
+                },
+            }
+        ).decode()
+
+        # Clean up all connections created via session.send. Iterate over a
+        # snapshot, since connections may come and go while the sends are awaited,
+        # and notify them concurrently so one slow peer does not hold up the rest
+        connection_ids = [
+            connection_id
+            for connection_id in self.active_connections
+            if client_id in connection_id
+        ]
+        results = await asyncio.gather(
+            *(
+                self.send_message(client_id=connection_id, message=unregistered_message)
+                for connection_id in connection_ids
+            ),
+            return_exceptions=True,
+        )
+        for connection_id, result in zip(connection_ids, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    "Failed to notify %s that agent %s has been unregistered: %r",
+                    connection_id,
+                    client_id,
+                    result,
                 )
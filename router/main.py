@@ -33,13 +33,21 @@ async def websocket_endpoint(websocket: WebSocket):
         # Reject connection if no valid authorization header
         await websocket.close(code=4000, reason="Missing Authorization header")
     else:
+        # Bind the per-frame calls once instead of looking them up on every message
+        receive = websocket.receive
+        process_message = ws_connection_manager.process_message
         try:
             # Continuously listen for messages
             while True:
-                data = await websocket.receive_text()
-                await ws_connection_manager.process_message(
-                    client_id, data, agent_jwt=agent_jwt
-                )
+                # Take the raw frame so text and binary frames both go straight
+                # to the JSON decoder without an intermediate str conversion
+                frame = await receive()
+                if frame["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(frame["code"], frame.get("reason"))
+                data = frame.get("text")
+                if data is None:
+                    data = frame["bytes"]
+                await process_message(client_id, data, agent_jwt=agent_jwt)
         except WebSocketDisconnect:
             # Handle client disconnection
             await ws_connection_manager.disconnect(client_id)
@@ -57,4 +65,4 @@ async def invoke_agent(message: Message) -> MessageResponse:
 
 if __name__ == "__main__":
     # Run the FastAPI app using Uvicorn on port 8080 with auto-reload
-    uvicorn.run("main:app", port=8080, reload=True)
+    uvicorn.run("main:app", port=8080, reload=True, ws_per_message_deflate=False)